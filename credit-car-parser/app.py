@@ -1,70 +1,131 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request, jsonify
+import json
 import os
 from werkzeug.utils import secure_filename
-from parsers.hdfc_parser import HDFCParser
-from parsers.icici_parser import ICICIParser
-from parsers.sbi_parser import SBIParser
-from parsers.axis_parser import AxisParser
-from parsers.kotak_parser import KotakParser
+from parsers import PARSERS
+from parsers.preflight import preflight, PreflightError
 
 app = Flask(__name__)
 app.config['UPLOAD_FOLDER'] = 'uploads'
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+app.config['MAX_PAGES'] = None  # Optional page limit checked in preflight, off by default
 
 # Ensure upload folder exists
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 
-# Bank parser mapping
-PARSERS = {
-    'HDFC': HDFCParser,
-    'ICICI': ICICIParser,
-    'SBI': SBIParser,
-    'AXIS': AxisParser,
-    'KOTAK': KotakParser
-}
-
 @app.route('/')
 def index():
     return render_template('index.html')
 
-@app.route('/parse', methods=['POST'])
-def parse_statement():
+class UploadError(Exception):
+    """Raised when an upload is rejected before parsing starts"""
+
+    def __init__(self, message, status=400, code=None):
+        super().__init__(message)
+        self.message = message
+        self.status = status
+        self.code = code
+
+    def response(self):
+        body = {'error': self.message}
+        if self.code:
+            body['code'] = self.code
+        return jsonify(body), self.status
+
+def save_upload():
+    """Validate the uploaded statement, save it and run the preflight check"""
     if 'file' not in request.files:
-        return jsonify({'error': 'No file uploaded'}), 400
+        raise UploadError('No file uploaded')
     
     file = request.files['file']
     bank = request.form.get('bank', '').upper()
     
     if file.filename == '':
-        return jsonify({'error': 'No file selected'}), 400
+        raise UploadError('No file selected')
     
     if bank not in PARSERS:
-        return jsonify({'error': 'Invalid bank selected'}), 400
+        raise UploadError('Invalid bank selected')
     
-    if file and file.filename.endswith('.pdf'):
-        filename = secure_filename(file.filename)
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(filepath)
+    if not file.filename.endswith('.pdf'):
+        raise UploadError('Invalid file type. Please upload a PDF')
+    
+    filename = secure_filename(file.filename)
+    filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+    file.save(filepath)
+    
+    # Cheap check of the PDF structure before the full parse
+    try:
+        info = preflight(filepath, max_pages=app.config['MAX_PAGES'])
+    except Exception as e:
+        os.remove(filepath)
+        if isinstance(e, PreflightError):
+            raise UploadError(e.message, e.status, e.code)
+        raise
+    
+    return bank, filepath, info
+
+@app.route('/parse', methods=['POST'])
+def parse_statement():
+    try:
+        bank, filepath, info = save_upload()
+    except UploadError as e:
+        return e.response()
+    
+    try:
+        # Parse the PDF
+        parser = PARSERS[bank](filepath)
+        data = parser.parse()
+        
+        # Clean up uploaded file
+        os.remove(filepath)
         
+        return jsonify({
+            'success': True,
+            'data': data,
+            'page_count': info['page_count']
+        })
+    except Exception as e:
+        # Clean up on error
+        if os.path.exists(filepath):
+            os.remove(filepath)
+        return jsonify({'error': f'Parsing error: {str(e)}'}), 500
+
+def sse_event(event, payload):
+    return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+
+@app.route('/parse/stream', methods=['POST'])
+def parse_statement_stream():
+    """Same as /parse but streams progress as Server-Sent Events"""
+    try:
+        bank, filepath, info = save_upload()
+    except UploadError as e:
+        return e.response()
+    
+    def remove_upload():
+        if os.path.exists(filepath):
+            os.remove(filepath)
+    
+    def generate():
         try:
-            # Parse the PDF
+            yield sse_event('start', {'page_count': info['page_count'], 'bank': PARSERS[bank].BANK_NAME})
             parser = PARSERS[bank](filepath)
-            data = parser.parse()
-            
-            # Clean up uploaded file
-            os.remove(filepath)
-            
-            return jsonify({
-                'success': True,
-                'data': data
-            })
+            for event, payload in parser.iter_parse():
+                if event == 'done':
+                    payload = {'success': True, 'data': payload, 'page_count': info['page_count']}
+                yield sse_event(event, payload)
         except Exception as e:
-            # Clean up on error
-            if os.path.exists(filepath):
-                os.remove(filepath)
-            return jsonify({'error': f'Parsing error: {str(e)}'}), 500
+            yield sse_event('error', {'error': f'Parsing error: {str(e)}'})
+        finally:
+            # Clean up uploaded file, also when the client disconnects
+            remove_upload()
     
-    return jsonify({'error': 'Invalid file type. Please upload a PDF'}), 400
+    response = Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'  # Stop nginx from buffering the stream
+    })
+    # The generator's finally never runs if the stream is closed before it starts
+    response.call_on_close(remove_upload)
+    return response
 
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=int(os.environ.get('PORT', 5000)), debug=False)
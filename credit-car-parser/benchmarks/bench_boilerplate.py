@@ -0,0 +1,74 @@
+"""
+Measure what stripping repeated header/footer lines costs and saves.
+
+Runs on the snapshot fixtures:
+    python benchmarks/bench_boilerplate.py
+    python benchmarks/bench_boilerplate.py --repeat 4   # pages repeated 4x, a longer statement
+
+For each statement it reports the text size before/after stripping, the
+time strip_boilerplate takes, the time of all extract_* methods on the
+raw and stripped text, and the net saving (negative means slower), in
+microseconds (best of several runs). 'pdf ms' is the time pdfplumber
+takes to extract the text of the source PDF, to compare the net cost
+with the whole parse (skipped with --repeat or if the PDF is missing).
+"""
+import argparse
+import os
+import sys
+import timeit
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
+sys.path.insert(0, os.path.join(APP_DIR, 'tests'))
+
+from parsers import PARSERS
+from parsers.boilerplate import strip_boilerplate
+from snapshots import load_fixtures, source_path
+
+NUMBER = 200
+REPEAT = 7
+
+
+def best_time(func, number=NUMBER, repeat=REPEAT):
+    """Best time of one call in microseconds"""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e6
+
+
+def extract_fields(parser, text):
+    parser.text = text
+    return parser.extract_fields()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    arg_parser.add_argument('--repeat', type=int, default=1, help='Repeat the pages of each statement N times')
+    args = arg_parser.parse_args()
+
+    print(f"{'statement':<12}{'pages':>6}{'chars':>16}{'strip us':>10}{'extract us':>16}{'net us':>9}{'pdf ms':>8}")
+
+    for path, fixture in load_fixtures():
+        pages = fixture['pages'] * args.repeat
+        parser_class = PARSERS[fixture['bank']]
+        parser = parser_class.from_page_texts(pages)
+        raw_text = "\n".join(pages)
+        stripped_text = "\n".join(strip_boilerplate(pages))
+
+        strip_us = best_time(lambda: strip_boilerplate(pages))
+        raw_us = best_time(lambda: extract_fields(parser, raw_text))
+        stripped_us = best_time(lambda: extract_fields(parser, stripped_text))
+        net_us = raw_us - (strip_us + stripped_us)
+
+        pdf_ms = '-'
+        pdf_path = source_path(fixture)
+        if args.repeat == 1 and os.path.exists(pdf_path):
+            pdf_us = best_time(lambda: parser_class.extract_page_texts(pdf_path), number=1, repeat=3)
+            pdf_ms = f'{pdf_us / 1000:.0f}'
+
+        name = os.path.splitext(os.path.basename(path))[0]
+        chars = f'{len(raw_text)}->{len(stripped_text)}'
+        extract = f'{raw_us:.0f}->{stripped_us:.0f}'
+        print(f'{name:<12}{len(pages):>6}{chars:>16}{strip_us:>10.1f}{extract:>16}{net_us:>+9.1f}{pdf_ms:>8}')
+
+
+if __name__ == '__main__':
+    main()
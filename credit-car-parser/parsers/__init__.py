@@ -5,4 +5,13 @@ from .sbi_parser import SBIParser
 from .axis_parser import AxisParser
 from .kotak_parser import KotakParser
 
-__all__ = ['HDFCParser', 'ICICIParser', 'SBIParser', 'AxisParser', 'KotakParser']
\ No newline at end of file
+# Bank parser mapping
+PARSERS = {
+    'HDFC': HDFCParser,
+    'ICICI': ICICIParser,
+    'SBI': SBIParser,
+    'AXIS': AxisParser,
+    'KOTAK': KotakParser
+}
+
+__all__ = ['HDFCParser', 'ICICIParser', 'SBIParser', 'AxisParser', 'KotakParser', 'PARSERS']
\ No newline at end of file
@@ -2,17 +2,7 @@ from .base_parser import BaseParser
 import re
 
 class AxisParser(BaseParser):
-    def parse(self):
-        self.extract_text()
-        
-        return {
-            'bank': 'Axis Bank',
-            'card_last_4_digits': self.extract_card_number(),
-            'statement_date': self.extract_statement_date(),
-            'payment_due_date': self.extract_due_date(),
-            'total_amount_due': self.extract_total_due(),
-            'minimum_amount_due': self.extract_minimum_due()
-        }
+    BANK_NAME = 'Axis Bank'
     
     def extract_card_number(self):
         # Axis format: "45145700****5541"
@@ -1,24 +1,102 @@
 import pdfplumber
 import re
-from abc import ABC, abstractmethod
+from abc import ABC
+from .boilerplate import BoilerplateFilter, strip_boilerplate
 
 class BaseParser(ABC):
+    # Bank name returned in the parse result, set by each bank parser
+    BANK_NAME = None
+    
+    # Summary fields and the method every bank parser uses to extract them
+    FIELDS = {
+        'card_last_4_digits': 'extract_card_number',
+        'statement_date': 'extract_statement_date',
+        'payment_due_date': 'extract_due_date',
+        'total_amount_due': 'extract_total_due',
+        'minimum_amount_due': 'extract_minimum_due'
+    }
+    
     def __init__(self, pdf_path):
         self.pdf_path = pdf_path
         self.text = ""
-        self.pages = []
+        self.page_texts = []
+        
+    @classmethod
+    def from_page_texts(cls, page_texts, pdf_path=None):
+        """Create a parser from already extracted page text (skips pdfplumber)"""
+        parser = cls(pdf_path)
+        parser.page_texts = list(page_texts)
+        return parser
         
     def extract_text(self):
         """Extract text from all pages of PDF"""
-        with pdfplumber.open(self.pdf_path) as pdf:
-            self.pages = pdf.pages
-            self.text = "\n".join([page.extract_text() or "" for page in pdf.pages])
+        if not self.page_texts:
+            self.page_texts = self.extract_page_texts(self.pdf_path)
+        # Drop headers/footers repeated across pages of long statements
+        self.text = "\n".join(strip_boilerplate(self.page_texts))
         return self.text
     
-    @abstractmethod
+    @staticmethod
+    def extract_page_texts(pdf_path):
+        """Run pdfplumber over the PDF and return the text of each page"""
+        with pdfplumber.open(pdf_path) as pdf:
+            return [page.extract_text() or "" for page in pdf.pages]
+    
     def parse(self):
-        """Each bank parser must implement this method"""
-        pass
+        """Extract the text and return the bank name and every summary field"""
+        self.extract_text()
+        return self.extract_fields()
+    
+    def extract_fields(self):
+        """Run every field extractor in FIELDS over self.text"""
+        data = {'bank': self.BANK_NAME}
+        for field, method in self.FIELDS.items():
+            data[field] = getattr(self, method)()
+        return data
+    
+    def iter_page_texts(self):
+        """Yield (page_number, total_pages, text) as each page is extracted"""
+        if self.page_texts:
+            total = len(self.page_texts)
+            for number, text in enumerate(self.page_texts, 1):
+                yield number, total, text
+            return
+        
+        with pdfplumber.open(self.pdf_path) as pdf:
+            total = len(pdf.pages)
+            for number, page in enumerate(pdf.pages, 1):
+                yield number, total, page.extract_text() or ""
+    
+    def iter_parse(self):
+        """
+        Parse page by page, yielding (event, payload) progress events:
+        'page' after each page is extracted, 'field' when a summary field
+        is found in the pages read so far, and 'done' with the same result as parse().
+        A field can be sent again with a new value as more pages are read.
+        """
+        page_texts = []
+        cleaned_texts = []
+        boilerplate = None
+        resolved = {}
+        
+        for number, total, text in self.iter_page_texts():
+            if boilerplate is None:
+                boilerplate = BoilerplateFilter(total)
+            page_texts.append(text)
+            yield 'page', {'page': number, 'total': total}
+            
+            # Only the new page is cleaned, earlier pages are already stripped
+            cleaned_texts.append(boilerplate.add_page(text))
+            self.text = "\n".join(cleaned_texts)
+            for field, method in self.FIELDS.items():
+                value = getattr(self, method)()
+                if value != "Not Found" and resolved.get(field) != value:
+                    resolved[field] = value
+                    yield 'field', {'field': field, 'value': value, 'page': number}
+        
+        # Final result from the whole document, the text is already extracted
+        self.page_texts = page_texts
+        yield 'done', self.extract_fields()
     
     def extract_with_regex(self, pattern, default="Not Found"):
         """Helper method to extract data using regex"""
@@ -0,0 +1,94 @@
+# A line must have at least this many letters to count as boilerplate
+# anywhere on the page, so repeated amounts/dates (e.g. a balance carried
+# over to the next page) are never dropped from the page body
+MIN_LETTERS = 4
+
+# Lines can only repeat across pages on multi-page statements. Stripping
+# is run for correctness (boilerplate dates and amounts must not reach the
+# parsers' fallbacks), it costs tens of microseconds per statement against
+# hundreds of milliseconds for pdfplumber, see benchmarks/bench_boilerplate.py
+MIN_PAGES = 2
+
+# Number of lines at the top and bottom of a page treated as the
+# header/footer band. Lines repeated in the band of several pages are
+# dropped even if they are only a date or an amount
+BAND_LINES = 3
+
+
+# Byte tables deleting everything but ASCII letters / digits, counting
+# with bytes.translate is much faster than a per-character loop
+NOT_LETTERS = bytes(c for c in range(256) if not (65 <= c <= 90 or 97 <= c <= 122))
+NOT_DIGITS = bytes(c for c in range(256) if not 48 <= c <= 57)
+
+
+def is_candidate(line):
+    # Non-ASCII characters (₹, ∞) count as neither letters nor digits
+    data = line.encode('ascii', 'ignore')
+    letters = len(data.translate(None, NOT_LETTERS))
+    digits = len(data.translate(None, NOT_DIGITS))
+    return letters >= MIN_LETTERS and letters > digits
+
+
+class BoilerplateFilter:
+    """
+    Remove header, footer and disclaimer lines repeated across pages.
+
+    Pages are added in order. A line is dropped when an earlier page
+    already had it and it is either mostly text, or it sits in the
+    header/footer band of both pages. The first occurrence is always kept,
+    so fields printed in a repeated header (card number, statement date)
+    are still found, and each page can be cleaned as soon as it is read.
+    Statements shorter than min_pages are left untouched.
+    """
+
+    def __init__(self, page_count, min_pages=MIN_PAGES):
+        self.enabled = page_count >= min_pages
+        self.seen = set()
+        self.seen_band = set()
+        # Repeated lines already passed to is_candidate(), and those that
+        # are text. Each distinct line is classified once, with set operations
+        # doing the per-page work
+        self.classified = set()
+        self.text_lines = set()
+
+    def add_page(self, text):
+        """Return the page text without lines repeated from earlier pages"""
+        if not self.enabled:
+            return text
+
+        lines = text.split('\n')
+        band = lines[:BAND_LINES] + lines[-BAND_LINES:]
+
+        # Most pages share no line with earlier pages, skip the line loop
+        cleaned = text
+        repeated = self.seen.intersection(lines)
+        repeated.discard('')
+        if repeated:
+            # Text lines are dropped anywhere, other lines only in the band
+            for line in repeated - self.classified:
+                if is_candidate(line):
+                    self.text_lines.add(line)
+            self.classified |= repeated
+            anywhere = repeated & self.text_lines
+            in_band = {line for line in repeated.intersection(self.seen_band) if line.strip()}
+            if anywhere or in_band:
+                # Split the page into header band, body and footer band so
+                # the body is filtered with a plain set lookup per line
+                body_end = max(BAND_LINES, len(lines) - BAND_LINES)
+                head, body, tail = lines[:BAND_LINES], lines[BAND_LINES:body_end], lines[body_end:]
+                drop_band = anywhere | in_band
+                cleaned = '\n'.join(
+                    [line for line in head if line not in drop_band]
+                    + [line for line in body if line not in anywhere]
+                    + [line for line in tail if line not in drop_band]
+                )
+
+        self.seen.update(lines)
+        self.seen_band.update(band)
+        return cleaned
+
+
+def strip_boilerplate(page_texts, min_pages=MIN_PAGES):
+    """Return the cleaned text of each page, see BoilerplateFilter"""
+    boilerplate = BoilerplateFilter(len(page_texts), min_pages)
+    return [boilerplate.add_page(text) for text in page_texts]
@@ -2,17 +2,7 @@ from .base_parser import BaseParser
 import re
 
 class KotakParser(BaseParser):
-    def parse(self):
-        self.extract_text()
-        
-        return {
-            'bank': 'Kotak Mahindra Bank',
-            'card_last_4_digits': self.extract_card_number(),
-            'statement_date': self.extract_statement_date(),
-            'payment_due_date': self.extract_due_date(),
-            'total_amount_due': self.extract_total_due(),
-            'minimum_amount_due': self.extract_minimum_due()
-        }
+    BANK_NAME = 'Kotak Mahindra Bank'
     
     def extract_card_number(self):
         # Kotak format: "414767XXXXXX6705"
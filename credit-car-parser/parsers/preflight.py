@@ -0,0 +1,136 @@
+from pdfminer.pdfparser import PDFParser
+from pdfminer.pdfdocument import PDFDocument, PDFPasswordIncorrect, PDFEncryptionError
+from pdfminer.pdftypes import resolve1, PDFStream
+from pdfminer.psparser import LIT
+from pdfminer.utils import decode_text
+
+# Only the header is read to check the magic bytes, the PDF spec allows
+# some junk before "%PDF-" so we look at the first 1KB
+PDF_MAGIC = b'%PDF-'
+HEADER_SIZE = 1024
+
+LITERAL_PAGES = LIT('Pages')
+LITERAL_FORM = LIT('Form')
+
+
+class PreflightError(Exception):
+    """Raised when an upload is rejected before the full parse"""
+
+    def __init__(self, code, message, status=422):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.status = status
+
+
+def preflight(pdf_path, max_pages=None):
+    """
+    Cheap sanity check of a PDF before handing it to pdfplumber.
+
+    Reads only the header, trailer, xref and page tree (no content
+    streams are decoded) and returns basic facts about the document.
+    Raises PreflightError with a specific code if the file can't be parsed.
+    """
+    with open(pdf_path, 'rb') as f:
+        header = f.read(HEADER_SIZE)
+        if PDF_MAGIC not in header:
+            raise PreflightError('not_pdf', 'File is not a valid PDF', status=400)
+        version = header[header.index(PDF_MAGIC) + len(PDF_MAGIC):].split(b'\n')[0][:3]
+
+        f.seek(0)
+        try:
+            # Empty password works for statements that are encrypted
+            # only to restrict printing/copying (e.g. ICICI)
+            doc = PDFDocument(PDFParser(f), password='')
+        except PDFPasswordIncorrect:
+            raise PreflightError('encrypted', 'PDF is password protected. Please upload an unlocked statement')
+        except PDFEncryptionError:
+            raise PreflightError('unsupported_encryption', 'PDF uses an unsupported encryption method')
+        except Exception:
+            # pdfminer raises all kinds of errors on damaged files
+            # (syntax errors, KeyError, even AssertionError)
+            raise PreflightError('corrupt', 'PDF file is damaged or incomplete')
+
+        try:
+            page_count, has_text_layer = scan_page_tree(doc)
+            producer = get_producer(doc)
+        except Exception:
+            raise PreflightError('corrupt', 'PDF page tree is damaged')
+
+        if page_count == 0:
+            raise PreflightError('no_pages', 'PDF has no pages')
+
+        if max_pages and page_count > max_pages:
+            raise PreflightError('too_many_pages', f'PDF has {page_count} pages, the maximum is {max_pages}', status=413)
+
+        if not has_text_layer:
+            raise PreflightError('no_text_layer', 'PDF has no text layer (scanned statement?). Please upload the original e-statement')
+
+        return {
+            'pdf_version': version.decode('latin-1', 'replace'),
+            'page_count': page_count,
+            'encrypted': doc.encryption is not None,
+            'has_text_layer': has_text_layer,
+            'producer': producer
+        }
+
+
+def scan_page_tree(doc):
+    """Walk the page tree and return (page_count, has_text_layer)"""
+    page_count = 0
+    has_text_layer = False
+    visited = set()
+
+    # Stack of (node, inherited resources), resources can be set on
+    # any Pages node and apply to every page below it
+    stack = [(doc.catalog.get('Pages'), None)]
+    while stack:
+        ref, inherited = stack.pop()
+        node_id = getattr(ref, 'objid', None)
+        if node_id is not None:
+            if node_id in visited:
+                continue
+            visited.add(node_id)
+
+        node = resolve1(ref)
+        if not isinstance(node, dict):
+            continue
+
+        resources = resolve1(node.get('Resources')) or inherited
+        if node.get('Type') is LITERAL_PAGES or 'Kids' in node:
+            for kid in reversed(resolve1(node.get('Kids')) or []):
+                stack.append((kid, resources))
+            continue
+
+        page_count += 1
+        if not has_text_layer and has_fonts(resources):
+            has_text_layer = True
+
+    return page_count, has_text_layer
+
+
+def has_fonts(resources, depth=0):
+    """A page can only contain text if it references a font, directly or through a form XObject"""
+    if not isinstance(resources, dict) or depth > 3:
+        return False
+    if resolve1(resources.get('Font')):
+        return True
+
+    xobjects = resolve1(resources.get('XObject')) or {}
+    for xobj in xobjects.values():
+        xobj = resolve1(xobj)
+        if isinstance(xobj, PDFStream) and xobj.get('Subtype') is LITERAL_FORM:
+            if has_fonts(resolve1(xobj.get('Resources')), depth + 1):
+                return True
+
+    return False
+
+
+def get_producer(doc):
+    for info in doc.info:
+        producer = resolve1(info.get('Producer'))
+        if isinstance(producer, bytes):
+            return decode_text(producer).strip() or None
+        if isinstance(producer, str):
+            return producer.strip() or None
+    return None
@@ -0,0 +1,137 @@
+"""
+Snapshot fixtures for the parser tests.
+
+Each fixture stores the page text pdfplumber extracted from one statement,
+the sha256 of the source PDF and the expected parse() output, so the
+tests run the parsers without decoding any PDF.
+
+Refresh fixtures (e.g. after upgrading pdfplumber):
+    python tests/snapshots.py                       # all existing fixtures + cc-stmt/*.pdf
+    python tests/snapshots.py --update-expected     # also overwrite the expected output
+    python tests/snapshots.py --bank HDFC a.pdf b.pdf   # add new statements
+"""
+import argparse
+import glob
+import hashlib
+import json
+import os
+import sys
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_DIR = os.path.join(APP_DIR, 'tests', 'fixtures')
+SAMPLES_DIR = os.path.join(os.path.dirname(APP_DIR), 'cc-stmt')
+
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
+
+
+def sha256_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def fixture_path(bank, pdf_path):
+    name = os.path.splitext(os.path.basename(pdf_path))[0]
+    return os.path.join(FIXTURES_DIR, bank.lower(), name + '.json')
+
+
+def source_path(fixture):
+    """Absolute path of the PDF a fixture was generated from"""
+    return os.path.normpath(os.path.join(APP_DIR, fixture['source']))
+
+
+def load_fixtures():
+    """Return (path, fixture) for every fixture, sorted by path"""
+    fixtures = []
+    for path in sorted(glob.glob(os.path.join(FIXTURES_DIR, '*', '*.json'))):
+        with open(path, encoding='utf-8') as f:
+            fixtures.append((path, json.load(f)))
+    return fixtures
+
+
+def extractor_version():
+    """Text extraction backend the page text in the fixtures comes from"""
+    import pdfplumber
+    return f'pdfplumber {pdfplumber.__version__}'
+
+
+def build_fixture(bank, pdf_path, expected=None):
+    """Extract the page text of a PDF and snapshot the parser output"""
+    from parsers import PARSERS
+
+    parser_class = PARSERS[bank]
+    page_texts = parser_class.extract_page_texts(pdf_path)
+    if expected is None:
+        expected = parser_class.from_page_texts(page_texts).parse()
+
+    return {
+        'bank': bank,
+        'source': os.path.relpath(os.path.abspath(pdf_path), APP_DIR).replace(os.sep, '/'),
+        'sha256': sha256_file(pdf_path),
+        'extractor': extractor_version(),
+        'pages': page_texts,
+        'expected': expected
+    }
+
+
+def write_fixture(path, fixture):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(fixture, f, indent=2, ensure_ascii=False)
+        f.write('\n')
+
+
+def default_sources():
+    """(bank, pdf_path, fixture_path) for existing fixtures and the sample statements"""
+    from parsers import PARSERS
+
+    sources = {}
+    for path, fixture in load_fixtures():
+        sources[path] = (fixture['bank'], source_path(fixture))
+
+    for bank in PARSERS:
+        pdf_path = os.path.join(SAMPLES_DIR, bank.lower() + '.pdf')
+        if os.path.exists(pdf_path):
+            sources.setdefault(fixture_path(bank, pdf_path), (bank, pdf_path))
+
+    return [(bank, pdf_path, path) for path, (bank, pdf_path) in sorted(sources.items())]
+
+
+def main(argv=None):
+    from parsers import PARSERS
+
+    arg_parser = argparse.ArgumentParser(description='Regenerate parser snapshot fixtures from PDFs')
+    arg_parser.add_argument('pdfs', nargs='*', help='PDF statements to add (requires --bank)')
+    arg_parser.add_argument('--bank', type=str.upper, choices=sorted(PARSERS), help='Bank of the given PDFs')
+    arg_parser.add_argument('--update-expected', action='store_true',
+                            help='Overwrite the expected output of existing fixtures with the current parse result')
+    args = arg_parser.parse_args(argv)
+
+    if args.pdfs:
+        if not args.bank:
+            arg_parser.error('--bank is required when PDFs are given')
+        sources = [(args.bank, pdf_path, fixture_path(args.bank, pdf_path)) for pdf_path in args.pdfs]
+    else:
+        sources = default_sources()
+
+    for bank, pdf_path, path in sources:
+        if not os.path.exists(pdf_path):
+            print(f'skip {os.path.relpath(path, APP_DIR)}: source {pdf_path} not found')
+            continue
+
+        # Keep the reviewed expectations unless asked, so a backend change
+        # that alters the parse output shows up as a failing test
+        expected = None
+        if os.path.exists(path) and not args.update_expected:
+            with open(path, encoding='utf-8') as f:
+                expected = json.load(f)['expected']
+
+        write_fixture(path, build_fixture(bank, pdf_path, expected))
+        print(f'wrote {os.path.relpath(path, APP_DIR)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+import io
+import json
+import os
+
+import pytest
+
+from app import app
+from parsers import PARSERS
+from parsers.base_parser import BaseParser
+from snapshots import load_fixtures
+from test_preflight import build_pdf, TEXT_PAGE
+
+FIXTURE = next(fixture for _, fixture in load_fixtures() if fixture['bank'] == 'HDFC')
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setitem(app.config, 'UPLOAD_FOLDER', str(tmp_path))
+
+    # Serve the snapshot page text instead of decoding the uploaded PDF
+    def iter_page_texts(self):
+        for number, text in enumerate(FIXTURE['pages'], 1):
+            yield number, len(FIXTURE['pages']), text
+    monkeypatch.setattr(BaseParser, 'iter_page_texts', iter_page_texts)
+
+    return app.test_client()
+
+
+def post_stream(client, data=None, **kwargs):
+    return client.post('/parse/stream', data={
+        'bank': 'HDFC',
+        'file': (io.BytesIO(data or build_pdf([TEXT_PAGE, TEXT_PAGE])), 'statement.pdf')
+    }, **kwargs)
+
+
+def read_events(response):
+    """Split an SSE body into (event, payload), checking the framing"""
+    body = response.get_data(as_text=True)
+    assert body.endswith('\n\n')
+
+    events = []
+    for block in body[:-2].split('\n\n'):
+        event_line, data_line = block.split('\n')
+        assert event_line.startswith('event: ')
+        assert data_line.startswith('data: ')
+        events.append((event_line[len('event: '):], json.loads(data_line[len('data: '):])))
+    return events
+
+
+def test_stream_sends_progress_and_result(client, tmp_path):
+    response = post_stream(client)
+
+    assert response.status_code == 200
+    assert response.mimetype == 'text/event-stream'
+
+    events = read_events(response)
+    assert events[0] == ('start', {'page_count': 2, 'bank': 'HDFC Bank'})
+    assert [payload['page'] for event, payload in events if event == 'page'] == [1, 2]
+    assert events[-1] == ('done', {'success': True, 'data': FIXTURE['expected'], 'page_count': 2})
+    assert os.listdir(tmp_path) == []
+
+
+def test_stream_sends_error_event_when_parser_fails(client, tmp_path, monkeypatch):
+    def fail(self):
+        raise ValueError('boom')
+    monkeypatch.setattr(PARSERS['HDFC'], 'extract_card_number', fail)
+
+    events = read_events(post_stream(client))
+
+    assert events[-1] == ('error', {'error': 'Parsing error: boom'})
+    assert 'done' not in [event for event, _ in events]
+    assert os.listdir(tmp_path) == []
+
+
+def test_stream_rejects_bad_upload_with_json(client, tmp_path):
+    response = post_stream(client, b'not a pdf')
+
+    assert response.status_code == 400
+    assert response.get_json()['code'] == 'not_pdf'
+    assert os.listdir(tmp_path) == []
+
+
+def test_upload_removed_when_client_disconnects(client, tmp_path):
+    response = post_stream(client, buffered=False)
+    first = next(response.response)
+    assert first.startswith(b'event: start')
+    assert os.listdir(tmp_path) != []
+
+    response.close()
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_upload_removed_when_stream_never_starts(client, tmp_path):
+    response = post_stream(client, buffered=False)
+    response.close()
+
+    assert os.listdir(tmp_path) == []
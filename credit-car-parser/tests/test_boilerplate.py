@@ -0,0 +1,80 @@
+from parsers.hdfc_parser import HDFCParser
+from parsers.boilerplate import BoilerplateFilter, strip_boilerplate, MIN_PAGES
+
+HEADER = 'Paytm HDFC Bank Credit Card Statement'
+FOOTER = 'This is a computer generated statement'
+
+
+def page(*body):
+    return '\n'.join([HEADER, 'Card No 4695 25XX XXXX 3458', *body, FOOTER])
+
+
+def test_repeated_lines_kept_only_on_first_page():
+    pages = [page('Statement Date:12/03/2023', 'Total Dues 22,935.00'), page('28/02/2023 OVERLIMIT FEE 550.00')]
+
+    first, second = strip_boilerplate(pages, min_pages=2)
+
+    assert first == pages[0]
+    assert HEADER not in second
+    assert FOOTER not in second
+    assert '28/02/2023 OVERLIMIT FEE 550.00' in second
+
+
+def test_single_page_is_untouched():
+    pages = [page('Total Dues 22,935.00', HEADER)]
+    assert strip_boilerplate(pages, min_pages=1) == pages
+
+
+def test_statement_below_min_pages_is_untouched():
+    pages = [page('a'), page('b')]
+    assert strip_boilerplate(pages, min_pages=3) == pages
+
+
+def test_multi_page_statements_are_stripped_by_default():
+    assert MIN_PAGES == 2
+    assert strip_boilerplate([page('a'), page('b')])[1] == 'b'
+
+
+def test_header_date_does_not_reach_hdfc_due_date_fallback():
+    # No 'Payment Due Date' label, so HDFC falls back to the second date
+    # in the document, which must not be page 2's copy of the header date
+    header = ['Paytm HDFC Bank Credit Card Statement', '12/03/2023']
+    pages = [
+        '\n'.join(header + ['Card No 4695 25XX XXXX 3458', 'Account Summary', 'Credit Limit', 'Available Credit', 'Page 1']),
+        '\n'.join(header + ['Rewards Summary', 'Points Earned', '01/04/2023 PAYMENT RECEIVED', 'Page 2'])
+    ]
+
+    parser = HDFCParser.from_page_texts(pages)
+    parser.extract_text()
+
+    assert parser.extract_due_date() == '01/04/2023'
+
+
+def test_repeated_amounts_and_dates_in_page_body_are_kept():
+    # Keep the repeated lines away from the header/footer band
+    padding = ['Account Summary', 'Credit Limit', 'Available Credit']
+    body = padding + ['Previous Balance', '176,674.12 Dr', '24/02/2023', 'Purchases'] + padding
+    pages = [page(*body), page(*body)]
+
+    _, second = strip_boilerplate(pages, min_pages=2)
+
+    assert '176,674.12 Dr' in second
+    assert '24/02/2023' in second
+    assert 'Previous Balance' not in second
+
+
+def test_repeated_date_in_header_band_is_counted_once():
+    pages = ['12/03/2023\n' + page('Payment Due Date 01/04/2023'), '12/03/2023\n' + page('Domestic Transactions')]
+
+    text = '\n'.join(strip_boilerplate(pages, min_pages=2))
+
+    assert text.count('12/03/2023') == 1
+
+
+def test_filter_cleans_pages_one_at_a_time():
+    pages = [page('a'), page('b'), page('c')]
+
+    boilerplate = BoilerplateFilter(len(pages), min_pages=2)
+    cleaned = [boilerplate.add_page(text) for text in pages]
+
+    assert cleaned == strip_boilerplate(pages, min_pages=2)
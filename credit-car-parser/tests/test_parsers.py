@@ -0,0 +1,62 @@
+import os
+
+import pytest
+
+from parsers import PARSERS
+from snapshots import load_fixtures, extractor_version, sha256_file, source_path, APP_DIR
+
+FIXTURES = load_fixtures()
+IDS = [os.path.relpath(path, os.path.join(APP_DIR, 'tests', 'fixtures')) for path, _ in FIXTURES]
+
+
+def test_every_bank_has_a_fixture():
+    banks = {fixture['bank'] for _, fixture in FIXTURES}
+    assert banks == set(PARSERS)
+
+
+@pytest.mark.parametrize('path,fixture', FIXTURES, ids=IDS)
+def test_parse_matches_snapshot(path, fixture):
+    parser = PARSERS[fixture['bank']].from_page_texts(fixture['pages'])
+    assert parser.parse() == fixture['expected']
+
+
+@pytest.mark.parametrize('path,fixture', FIXTURES, ids=IDS)
+def test_fixture_matches_source_pdf(path, fixture):
+    pdf_path = source_path(fixture)
+    if not os.path.exists(pdf_path):
+        pytest.skip(f'source {fixture["source"]} not available')
+
+    assert sha256_file(pdf_path) == fixture['sha256'], \
+        'Source PDF changed, run: python tests/snapshots.py'
+
+
+@pytest.mark.parametrize('path,fixture', FIXTURES, ids=IDS)
+def test_fixture_matches_installed_extractor(path, fixture):
+    # The page text depends on the pdfplumber version, a fixture made with
+    # another version no longer tests what the app would extract
+    assert fixture['extractor'] == extractor_version(), \
+        'pdfplumber version changed, run: python tests/snapshots.py'
+
+
+@pytest.mark.parametrize('path,fixture', FIXTURES, ids=IDS)
+def test_iter_parse_streams_pages_and_fields(path, fixture):
+    parser = PARSERS[fixture['bank']].from_page_texts(fixture['pages'])
+    events = list(parser.iter_parse())
+
+    pages = [payload['page'] for event, payload in events if event == 'page']
+    assert pages == list(range(1, len(fixture['pages']) + 1))
+
+    assert events[-1] == ('done', fixture['expected'])
+
+    # The last value streamed for a field is the final one, and every
+    # field that was found at all is streamed
+    streamed = {}
+    for event, payload in events:
+        if event == 'field':
+            streamed[payload['field']] = payload['value']
+
+    for field, value in streamed.items():
+        assert value == fixture['expected'][field]
+
+    found = {field for field in parser.FIELDS if fixture['expected'][field] != 'Not Found'}
+    assert set(streamed) == found
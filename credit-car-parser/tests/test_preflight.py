@@ -0,0 +1,140 @@
+import hashlib
+import os
+import struct
+
+import pytest
+from pdfminer.arcfour import Arcfour
+
+from parsers.preflight import preflight, PreflightError
+from snapshots import SAMPLES_DIR
+
+TEXT_PAGE = b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Resources << /Font << /F1 3 0 R >> >> >>'
+IMAGE_PAGE = b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Resources << >> >>'
+FONT = b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>'
+
+
+# Password padding string from the PDF spec (standard security handler)
+PASSWORD_PAD = bytes.fromhex('28BF4E5E4E758A4164004E56FFFA01082E2E00B6D0683E802F0CA9FE6453697A')
+DOC_ID = b'0123456789abcdef'
+
+
+def standard_encryption(user_password, owner_password, filter_name=b'Standard'):
+    """40-bit RC4 encryption dictionary (V1/R2) for the given passwords"""
+    user = (user_password + PASSWORD_PAD)[:32]
+    owner = (owner_password + PASSWORD_PAD)[:32]
+    permissions = -4
+
+    o_value = Arcfour(hashlib.md5(owner).digest()[:5]).encrypt(user)
+    key = hashlib.md5(user + o_value + struct.pack('<i', permissions) + DOC_ID).digest()[:5]
+    u_value = Arcfour(key).encrypt(PASSWORD_PAD)
+
+    return b'<< /Filter /%s /V 1 /R 2 /O <%s> /U <%s> /P %d >>' % (
+        filter_name, o_value.hex().encode(), u_value.hex().encode(), permissions)
+
+
+def build_pdf(pages, encrypt=None):
+    """Minimal PDF with one object per page, pages reference font object 3"""
+    page_ids = range(4, 4 + len(pages))
+    kids = b' '.join(b'%d 0 R' % i for i in page_ids)
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        b'<< /Type /Pages /Kids [' + kids + b'] /Count %d >>' % len(pages),
+        FONT
+    ] + list(pages)
+
+    trailer = b''
+    if encrypt:
+        objects.append(encrypt)
+        trailer = b' /Encrypt %d 0 R /ID [<%s> <%s>]' % (len(objects), DOC_ID.hex().encode(), DOC_ID.hex().encode())
+
+    data = b'%PDF-1.4\n'
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(data))
+        data += b'%d 0 obj\n' % number + body + b'\nendobj\n'
+
+    xref = len(data)
+    data += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    data += b''.join(b'%010d 00000 n \n' % offset for offset in offsets)
+    data += b'trailer\n<< /Size %d /Root 1 0 R%s >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, trailer, xref)
+    return data
+
+
+@pytest.fixture
+def write_pdf(tmp_path):
+    def write(data):
+        path = tmp_path / 'statement.pdf'
+        path.write_bytes(data)
+        return str(path)
+    return write
+
+
+def rejection(path, **kwargs):
+    with pytest.raises(PreflightError) as excinfo:
+        preflight(path, **kwargs)
+    return excinfo.value
+
+
+def test_text_pdf_passes(write_pdf):
+    info = preflight(write_pdf(build_pdf([TEXT_PAGE, TEXT_PAGE])))
+    assert info['page_count'] == 2
+    assert info['has_text_layer'] is True
+    assert info['encrypted'] is False
+    assert info['pdf_version'] == '1.4'
+
+
+def test_not_pdf(write_pdf):
+    error = rejection(write_pdf(b'PK\x03\x04 this is a zip file'))
+    assert (error.code, error.status) == ('not_pdf', 400)
+
+
+def test_truncated_pdf_is_corrupt(write_pdf):
+    data = build_pdf([TEXT_PAGE])
+    error = rejection(write_pdf(data[:len(data) // 3]))
+    assert (error.code, error.status) == ('corrupt', 422)
+
+
+def test_no_pages(write_pdf):
+    error = rejection(write_pdf(build_pdf([])))
+    assert error.code == 'no_pages'
+
+
+def test_no_text_layer(write_pdf):
+    error = rejection(write_pdf(build_pdf([IMAGE_PAGE, IMAGE_PAGE])))
+    assert error.code == 'no_text_layer'
+
+
+def test_too_many_pages(write_pdf):
+    path = write_pdf(build_pdf([TEXT_PAGE] * 3))
+    assert preflight(path, max_pages=3)['page_count'] == 3
+
+    error = rejection(path, max_pages=2)
+    assert (error.code, error.status) == ('too_many_pages', 413)
+
+
+def test_password_protected(write_pdf):
+    path = write_pdf(build_pdf([TEXT_PAGE], encrypt=standard_encryption(b'secret', b'owner')))
+    error = rejection(path)
+    assert (error.code, error.status) == ('encrypted', 422)
+
+
+def test_empty_user_password_passes(write_pdf):
+    path = write_pdf(build_pdf([TEXT_PAGE], encrypt=standard_encryption(b'', b'owner')))
+    info = preflight(path)
+    assert info['encrypted'] is True
+
+
+def test_unsupported_encryption(write_pdf):
+    path = write_pdf(build_pdf([TEXT_PAGE], encrypt=standard_encryption(b'secret', b'owner', b'Adobe.PubSec')))
+    error = rejection(path)
+    assert (error.code, error.status) == ('unsupported_encryption', 422)
+
+
+def test_empty_password_encrypted_statement_passes():
+    pdf_path = os.path.join(SAMPLES_DIR, 'icici.pdf')
+    if not os.path.exists(pdf_path):
+        pytest.skip('sample statement not available')
+
+    info = preflight(pdf_path)
+    assert info['encrypted'] is True
+    assert info['page_count'] == 3